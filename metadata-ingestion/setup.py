@@ -76,7 +76,7 @@ plugins: Dict[str, Set[str]] = {
     "sqlalchemy": sql_common,
     "athena": sql_common | {"PyAthena[SQLAlchemy]"},
     "bigquery": sql_common | {"pybigquery >= 0.6.0"},
-    "bigquery-usage": {"google-cloud-logging", "cachetools"},
+    "bigquery-usage": {"google-cloud-logging"},
     "druid": sql_common | {"pydruid>=0.6.2"},
     "feast": {"docker"},
     "glue": aws_common,
@@ -119,7 +119,6 @@ mypy_stubs = {
     "types-PyMySQL",
     "types-PyYAML",
     "types-freezegun",
-    "types-cachetools",
     # versions 0.1.13 and 0.1.14 seem to have issues
     "types-click==0.1.12",
 }
@@ -1,17 +1,21 @@
 import datetime
 import itertools
+import math
 import os
 import pathlib
 import subprocess
 import sys
 import tempfile
 import time
-from typing import List, NoReturn, Optional
+from typing import IO, List, NoReturn, Optional
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from datahub.cli.docker_check import (
+    check_datahub_container_health,
     check_local_docker_containers,
     get_client_with_error,
 )
@@ -34,6 +38,26 @@ GITHUB_ELASTIC_QUICKSTART_COMPOSE_URL = (
 )
 GITHUB_BOOTSTRAP_MCES_URL = f"{GITHUB_BASE_URL}/{BOOTSTRAP_MCES_FILE}"
 
+# Shared across downloads so that the connection to GitHub can be reused.
+_github_session = requests.Session()
+_github_session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    ),
+)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Container events which may change the outcome of the health check.
+DATAHUB_CONTAINER_EVENT_FILTERS = {
+    "label": "com.docker.compose.project=datahub",
+    "event": ["health_status", "die", "start"],
+}
+# Safety net in case we miss an event, e.g. one that fires between the health
+# check and the subscription to the event stream.
+HEALTH_CHECK_POLL_INTERVAL = datetime.timedelta(seconds=15)
+
 
 @click.group()
 def docker() -> None:
@@ -42,6 +66,14 @@ def docker() -> None:
     pass
 
 
+def _download_to_file(url: str, file: IO[bytes]) -> None:
+    # Stream the response in chunks so that we don't buffer the whole file in memory.
+    with _github_session.get(url, stream=True) as response:
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            file.write(chunk)
+
+
 def _print_issue_list_and_exit(
     issues: List[str], header: str, footer: Optional[str] = None
 ) -> NoReturn:
@@ -68,6 +100,47 @@ def check() -> None:
     docker_check_impl()
 
 
+def _wait_for_container_event(timeout: datetime.timedelta) -> None:
+    """Blocks until a relevant DataHub container event arrives or the timeout elapses."""
+
+    timeout_seconds = max(timeout.total_seconds(), 0)
+    with get_client_with_error() as (client, error):
+        if error:
+            time.sleep(timeout_seconds)
+            return
+
+        # The daemon closes the event stream by itself once `until` has passed.
+        events = client.events(
+            until=math.ceil(time.time() + timeout_seconds),
+            filters=DATAHUB_CONTAINER_EVENT_FILTERS,
+            decode=True,
+        )
+        try:
+            for _ in events:
+                break
+        finally:
+            events.close()
+
+
+def _wait_for_datahub_healthy(timeout: datetime.timedelta) -> List[str]:
+    """Waits for the DataHub containers to become healthy.
+
+    Instead of polling the Docker daemon on a fixed interval, we only re-run the
+    health check when a container event arrives. Returns the issues from the most
+    recent check, which will be empty if everything is healthy.
+    """
+
+    deadline = datetime.datetime.now() + timeout
+    issues = check_datahub_container_health()
+    while issues and datetime.datetime.now() < deadline:
+        _wait_for_container_event(
+            min(deadline - datetime.datetime.now(), HEALTH_CHECK_POLL_INTERVAL)
+        )
+        click.echo(".", nl=False)
+        issues = check_datahub_container_health()
+    return issues
+
+
 def should_use_neo4j_for_graph_service(graph_service_override):
     if graph_service_override is not None:
         if graph_service_override == "elasticsearch":
@@ -171,13 +244,12 @@ def quickstart(
             quickstart_compose_file.append(path)
 
             # Download the quickstart docker-compose file from GitHub.
-            quickstart_download_response = requests.get(
+            _download_to_file(
                 GITHUB_NEO4J_AND_ELASTIC_QUICKSTART_COMPOSE_URL
                 if should_use_neo4j_for_graph_service(graph_service_impl)
-                else GITHUB_ELASTIC_QUICKSTART_COMPOSE_URL
+                else GITHUB_ELASTIC_QUICKSTART_COMPOSE_URL,
+                tmp_file,
             )
-            quickstart_download_response.raise_for_status()
-            tmp_file.write(quickstart_download_response.content)
 
     # set version
     os.environ["DATAHUB_VERSION"] = version
@@ -216,7 +288,6 @@ def quickstart(
     # Start it up! (with retries)
     max_wait_time = datetime.timedelta(minutes=6)
     start_time = datetime.datetime.now()
-    sleep_interval = datetime.timedelta(seconds=2)
     up_interval = datetime.timedelta(seconds=30)
     up_attempts = 0
     while (datetime.datetime.now() - start_time) < max_wait_time:
@@ -226,14 +297,11 @@ def quickstart(
             subprocess.run(base_command + ["up", "-d", "--remove-orphans"])
             up_attempts += 1
 
-        # Check docker health every few seconds.
-        issues = check_local_docker_containers()
+        # Wait for the containers to become healthy, up until the next attempt.
+        next_attempt_time = start_time + min(up_attempts * up_interval, max_wait_time)
+        issues = _wait_for_datahub_healthy(next_attempt_time - datetime.datetime.now())
         if not issues:
             break
-
-        # Wait until next iteration.
-        click.echo(".", nl=False)
-        time.sleep(sleep_interval.total_seconds())
     else:
         # Falls through if the while loop doesn't exit via break.
         click.echo()
@@ -285,9 +353,7 @@ def ingest_sample_data(path: Optional[str]) -> None:
             path = str(pathlib.Path(tmp_file.name))
 
             # Download the bootstrap MCE file from GitHub.
-            mce_json_download_response = requests.get(GITHUB_BOOTSTRAP_MCES_URL)
-            mce_json_download_response.raise_for_status()
-            tmp_file.write(mce_json_download_response.content)
+            _download_to_file(GITHUB_BOOTSTRAP_MCES_URL, tmp_file)
         click.echo(f"Downloaded to {path}")
 
     # Verify that docker is up.
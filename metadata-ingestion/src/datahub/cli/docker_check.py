@@ -1,39 +1,54 @@
+import re
 from contextlib import contextmanager
 from typing import List
 
 import docker
 
-REQUIRED_CONTAINERS = [
-    "elasticsearch-setup",
-    "elasticsearch",
-    "datahub-gms",
-    "datahub-frontend-react",
-    "kafka-setup",
-    "schema-registry",
-    "broker",
-    "mysql",
-    "zookeeper",
-    # These two containers are not necessary - only helpful in debugging.
-    # "kafka-topics-ui",
-    # "schema-registry-ui",
-    # "kibana",
-    # "kafka-rest-proxy",
-    # "datahub-mce-consumer",
-    # "datahub-mae-consumer"
-]
-
-ENSURE_EXIT_SUCCESS = [
-    "kafka-setup",
-    "elasticsearch-setup",
-    "mysql-setup",
-]
-
-CONTAINERS_TO_CHECK_IF_PRESENT = [
-    # We only add this container in some cases, but if it's present, we
-    # definitely want to check that it exits properly.
-    "mysql-setup",
-    "neo4j",
-]
+REQUIRED_CONTAINERS = frozenset(
+    [
+        "elasticsearch-setup",
+        "elasticsearch",
+        "datahub-gms",
+        "datahub-frontend-react",
+        "kafka-setup",
+        "schema-registry",
+        "broker",
+        "mysql",
+        "zookeeper",
+        # These two containers are not necessary - only helpful in debugging.
+        # "kafka-topics-ui",
+        # "schema-registry-ui",
+        # "kibana",
+        # "kafka-rest-proxy",
+        # "datahub-mce-consumer",
+        # "datahub-mae-consumer"
+    ]
+)
+
+ENSURE_EXIT_SUCCESS = frozenset(
+    [
+        "kafka-setup",
+        "elasticsearch-setup",
+        "mysql-setup",
+    ]
+)
+
+CONTAINERS_TO_CHECK_IF_PRESENT = frozenset(
+    [
+        # We only add this container in some cases, but if it's present, we
+        # definitely want to check that it exits properly.
+        "mysql-setup",
+        "neo4j",
+    ]
+)
+
+CONTAINERS_TO_CHECK = REQUIRED_CONTAINERS | CONTAINERS_TO_CHECK_IF_PRESENT
+
+# The low-level container listing summarizes the health check and exit code in
+# its human-readable status, e.g. "Up 2 minutes (healthy)" or "Exited (1) 3 seconds ago".
+# Parsing these lets us avoid a separate inspect call for every container.
+CONTAINER_HEALTH_REGEX = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+CONTAINER_EXIT_CODE_REGEX = re.compile(r"^Exited \((-?\d+)\)")
 
 # Docker seems to under-report memory allocated, so we also need a bit of buffer to account for it.
 MIN_MEMORY_NEEDED = 3.8  # GB
@@ -56,6 +71,62 @@ def memory_in_gb(mem_bytes: int) -> float:
     return mem_bytes / (1024 * 1024 * 1000)
 
 
+def container_name(container: dict) -> str:
+    # The low-level API reports names with a leading slash, e.g. "/datahub-gms".
+    return container["Names"][0].lstrip("/")
+
+
+def _check_datahub_containers(client: docker.DockerClient) -> List[str]:
+    issues: List[str] = []
+
+    # This only lists the containers, and does not inspect each one individually.
+    containers = client.api.containers(
+        all=True,
+        filters={
+            "label": "com.docker.compose.project=datahub",
+        },
+    )
+
+    # Check number of containers.
+    if len(containers) == 0:
+        issues.append("quickstart.sh or dev.sh is not running")
+    else:
+        existing_containers = set(container_name(container) for container in containers)
+        missing_containers = REQUIRED_CONTAINERS - existing_containers
+        for missing in missing_containers:
+            issues.append(f"{missing} container is not present")
+
+    # Check that the containers are running and healthy.
+    for container in containers:
+        name = container_name(container)
+        if name not in CONTAINERS_TO_CHECK:
+            # Ignores things like "datahub-frontend" which are no longer used.
+            # This way, we only check required containers like "datahub-frontend-react"
+            # even if there are some old containers lying around.
+            continue
+
+        state = container["State"]
+        status = container["Status"]
+        if name in ENSURE_EXIT_SUCCESS:
+            exit_code = CONTAINER_EXIT_CODE_REGEX.match(status)
+            if state != "exited":
+                issues.append(f"{name} is still running")
+            elif not exit_code or int(exit_code.group(1)) != 0:
+                issues.append(f"{name} did not exit cleanly")
+
+        elif state != "running":
+            issues.append(f"{name} is not running")
+        else:
+            # Containers without a health check won't report a health status.
+            health = CONTAINER_HEALTH_REGEX.search(status)
+            if health and health.group(1) == "health: starting":
+                issues.append(f"{name} is still starting")
+            elif health and health.group(1) != "healthy":
+                issues.append(f"{name} is running but not healthy")
+
+    return issues
+
+
 def check_local_docker_containers(preflight_only: bool = False) -> List[str]:
     issues: List[str] = []
     with get_client_with_error() as (client, error):
@@ -73,44 +144,20 @@ def check_local_docker_containers(preflight_only: bool = False) -> List[str]:
         if preflight_only:
             return issues
 
-        containers = client.containers.list(
-            all=True,
-            filters={
-                "label": "com.docker.compose.project=datahub",
-            },
-        )
-
-        # Check number of containers.
-        if len(containers) == 0:
-            issues.append("quickstart.sh or dev.sh is not running")
-        else:
-            existing_containers = set(container.name for container in containers)
-            missing_containers = set(REQUIRED_CONTAINERS) - existing_containers
-            for missing in missing_containers:
-                issues.append(f"{missing} container is not present")
-
-        # Check that the containers are running and healthy.
-        for container in containers:
-            if container.name not in (
-                REQUIRED_CONTAINERS + CONTAINERS_TO_CHECK_IF_PRESENT
-            ):
-                # Ignores things like "datahub-frontend" which are no longer used.
-                # This way, we only check required containers like "datahub-frontend-react"
-                # even if there are some old containers lying around.
-                continue
-
-            if container.name in ENSURE_EXIT_SUCCESS:
-                if container.status != "exited":
-                    issues.append(f"{container.name} is still running")
-                elif container.attrs["State"]["ExitCode"] != 0:
-                    issues.append(f"{container.name} did not exit cleanly")
-
-            elif container.status != "running":
-                issues.append(f"{container.name} is not running")
-            elif "Health" in container.attrs["State"]:
-                if container.attrs["State"]["Health"]["Status"] == "starting":
-                    issues.append(f"{container.name} is still starting")
-                elif container.attrs["State"]["Health"]["Status"] != "healthy":
-                    issues.append(f"{container.name} is running but not healthy")
+        issues.extend(_check_datahub_containers(client))
 
     return issues
+
+
+def check_datahub_container_health() -> List[str]:
+    """Checks only the state and health of the DataHub containers.
+
+    This is cheaper than check_local_docker_containers, which also verifies the
+    host's Docker configuration, and so is better suited for repeated polling.
+    """
+
+    with get_client_with_error() as (client, error):
+        if error:
+            return ["Docker doesn't seem to be running. Did you start it?"]
+
+        return _check_datahub_containers(client)
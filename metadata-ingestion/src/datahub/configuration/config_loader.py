@@ -1,6 +1,8 @@
+import copy
+import functools
 import io
 import pathlib
-from typing import Union
+from typing import Dict, Union
 
 from expandvars import expandvars
 
@@ -8,6 +10,23 @@ from datahub.configuration.common import ConfigurationError, ConfigurationMechan
 from datahub.configuration.toml import TomlConfigurationMechanism
 from datahub.configuration.yaml import YamlConfigurationMechanism
 
+# The configuration mechanisms are stateless, so a single instance can be shared.
+_config_mechanisms: Dict[str, ConfigurationMechanism] = {
+    ".yaml": YamlConfigurationMechanism(),
+    ".yml": YamlConfigurationMechanism(),
+    ".toml": TomlConfigurationMechanism(),
+}
+
+# Only a handful of distinct configs are loaded in a single process, so a small
+# cache is enough while keeping the retained config text bounded.
+LOADED_CONFIGS_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=LOADED_CONFIGS_CACHE_SIZE)
+def _load_expanded_config(suffix: str, expanded_config_file: str) -> dict:
+    config_fp = io.StringIO(expanded_config_file)
+    return _config_mechanisms[suffix].load_config(config_fp)
+
 
 def load_config_file(config_file: Union[pathlib.Path, str]) -> dict:
     if isinstance(config_file, str):
@@ -15,12 +34,7 @@ def load_config_file(config_file: Union[pathlib.Path, str]) -> dict:
     if not config_file.is_file():
         raise ConfigurationError(f"Cannot open config file {config_file}")
 
-    config_mech: ConfigurationMechanism
-    if config_file.suffix in [".yaml", ".yml"]:
-        config_mech = YamlConfigurationMechanism()
-    elif config_file.suffix == ".toml":
-        config_mech = TomlConfigurationMechanism()
-    else:
+    if config_file.suffix not in _config_mechanisms:
         raise ConfigurationError(
             "Only .toml and .yml are supported. Cannot process file type {}".format(
                 config_file.suffix
@@ -31,7 +45,10 @@ def load_config_file(config_file: Union[pathlib.Path, str]) -> dict:
         raw_config_file = raw_config_fp.read()
 
     expanded_config_file = expandvars(raw_config_file, nounset=True)
-    config_fp = io.StringIO(expanded_config_file)
-    config = config_mech.load_config(config_fp)
 
-    return config
+    # The cache is keyed on the contents after variable expansion, so that changes
+    # to either the file or the environment are picked up.
+    loaded_config = _load_expanded_config(config_file.suffix, expanded_config_file)
+
+    # Callers are free to modify the config, so we always hand out a copy.
+    return copy.deepcopy(loaded_config)
@@ -1,12 +1,13 @@
 import collections
 import dataclasses
+import functools
 import logging
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Counter, Dict, Iterable, List, Optional, Union
+from typing import Any, Counter, Dict, Iterable, List, Optional, Tuple, Union
 
-import cachetools
 import pydantic
 from google.cloud.logging_v2.client import Client as GCPLoggingClient
 
@@ -17,9 +18,10 @@ from datahub.ingestion.api.workunit import UsageStatsWorkUnit
 from datahub.ingestion.source.usage_common import (
     BaseUsageConfig,
     GenericAggregatedDataset,
+    get_bucket_duration_delta,
     get_time_bucket,
 )
-from datahub.utilities.delayed_iter import delayed_iter
+from datahub.utilities.prefetch_iter import prefetch_iter
 
 logger = logging.getLogger(__name__)
 
@@ -33,73 +35,97 @@ AuditLogEntry = Any
 
 DEBUG_INCLUDE_FULL_PAYLOADS = False
 GCP_LOGGING_PAGE_SIZE = 1000
+REMOVE_EXTRAS_CACHE_SIZE = 131072
 
 # Handle yearly, monthly, daily, or hourly partitioning.
 # See https://cloud.google.com/bigquery/docs/partitioned-tables.
-PARTITIONED_TABLE_REGEX = re.compile(r"^(.+)_(\d{4}|\d{6}|\d{8}|\d{10})$")
+PARTITIONED_TABLE_REGEX = re.compile(r"(.+)_(\d{4}|\d{6}|\d{8}|\d{10})")
 
 BQ_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 BQ_FILTER_RULE_TEMPLATE = """
 protoPayload.serviceName="bigquery.googleapis.com"
 AND
 (
-    (
-        protoPayload.methodName="jobservice.jobcompleted"
-        AND
-        protoPayload.serviceData.jobCompletedEvent.eventName="query_job_completed"
-        AND
-        protoPayload.serviceData.jobCompletedEvent.job.jobStatus.state="DONE"
-        AND
-        NOT protoPayload.serviceData.jobCompletedEvent.job.jobStatus.error.code:*
-    )
-    OR
-    (
-        protoPayload.metadata.tableDataRead:*
-    )
+    {event_filter}
 )
 AND
 timestamp >= "{start_time}"
 AND
 timestamp <= "{end_time}"
 """.strip()
+BQ_QUERY_EVENT_FILTER = """
+protoPayload.methodName="jobservice.jobcompleted"
+    AND
+    protoPayload.serviceData.jobCompletedEvent.eventName="query_job_completed"
+    AND
+    protoPayload.serviceData.jobCompletedEvent.job.jobStatus.state="DONE"
+    AND
+    NOT protoPayload.serviceData.jobCompletedEvent.job.jobStatus.error.code:*
+""".strip()
+BQ_READ_EVENT_FILTER = "protoPayload.metadata.tableDataRead:*"
 
 
 @dataclass(frozen=True, order=True)
 class BigQueryTableRef:
+    # We create one of these for every log entry, so we avoid the per-instance __dict__.
+    __slots__ = ("project", "dataset", "table")
+
     project: str
     dataset: str
     table: str
 
+    # The default copy/pickle protocol restores slots with setattr, which the
+    # frozen dataclass rejects, so we restore them directly instead.
+    def __getstate__(self) -> Tuple[str, str, str]:
+        return (self.project, self.dataset, self.table)
+
+    def __setstate__(self, state: Tuple[str, str, str]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     @classmethod
     def from_spec_obj(cls, spec: dict) -> "BigQueryTableRef":
-        return BigQueryTableRef(spec["projectId"], spec["datasetId"], spec["tableId"])
+        return BigQueryTableRef(
+            sys.intern(spec["projectId"]),
+            sys.intern(spec["datasetId"]),
+            sys.intern(spec["tableId"]),
+        )
 
     @classmethod
     def from_string_name(cls, ref: str) -> "BigQueryTableRef":
         parts = ref.split("/")
         if parts[0] != "projects" or parts[2] != "datasets" or parts[4] != "tables":
             raise ValueError(f"invalid BigQuery table reference: {ref}")
-        return BigQueryTableRef(parts[1], parts[3], parts[5])
+        return BigQueryTableRef(
+            sys.intern(parts[1]), sys.intern(parts[3]), sys.intern(parts[5])
+        )
 
     def is_anonymous(self) -> bool:
         # Temporary tables will have a dataset that begins with an underscore.
         return self.dataset.startswith("_")
 
     def remove_extras(self) -> "BigQueryTableRef":
-        if "$" in self.table or "@" in self.table:
-            raise ValueError(f"cannot handle {self} - poorly formatted table name")
-
-        # Handle partitioned and sharded tables.
-        matches = PARTITIONED_TABLE_REGEX.match(self.table)
-        if matches:
-            return BigQueryTableRef(self.project, self.dataset, matches.group(1))
-
-        return self
+        return _remove_extras(self)
 
     def __str__(self) -> str:
         return f"projects/{self.project}/datasets/{self.dataset}/tables/{self.table}"
 
 
+# The same handful of tables shows up in a large number of log entries, so we
+# cache the result rather than running the regex against every event.
+@functools.lru_cache(maxsize=REMOVE_EXTRAS_CACHE_SIZE)
+def _remove_extras(ref: BigQueryTableRef) -> BigQueryTableRef:
+    if "$" in ref.table or "@" in ref.table:
+        raise ValueError(f"cannot handle {ref} - poorly formatted table name")
+
+    # Handle partitioned and sharded tables.
+    matches = PARTITIONED_TABLE_REGEX.fullmatch(ref.table)
+    if matches:
+        return BigQueryTableRef(ref.project, ref.dataset, matches.group(1))
+
+    return ref
+
+
 AggregatedDataset = GenericAggregatedDataset[BigQueryTableRef]
 
 
@@ -113,8 +139,30 @@ def _job_name_ref(project: str, jobId: str) -> str:
     return f"projects/{project}/jobs/{jobId}"
 
 
+def _has_nested_key(obj: Any, *keys: str) -> bool:
+    # Every entry is checked against each event type, so we avoid raising
+    # and catching an exception for entries that don't match.
+    for key in keys:
+        if not isinstance(obj, dict) or key not in obj:
+            return False
+        obj = obj[key]
+    return True
+
+
 @dataclass
 class ReadEvent:
+    # Like BigQueryTableRef, these are created for every log entry.
+    __slots__ = (
+        "timestamp",
+        "actor_email",
+        "resource",
+        "fieldsRead",
+        "readReason",
+        "jobName",
+        "payload",
+        "query",
+    )
+
     timestamp: datetime
     actor_email: str
 
@@ -127,24 +175,28 @@ class ReadEvent:
 
     # We really should use composition here since the query isn't actually
     # part of the read event, but this solution is just simpler.
-    query: Optional[str] = None  # populated via join
+    # Fields with defaults can't be combined with __slots__, so this is always
+    # initialized to None by from_entry.
+    query: Optional[str]  # populated via join
 
     @classmethod
     def can_parse_entry(cls, entry: AuditLogEntry) -> bool:
-        try:
-            entry.payload["metadata"]["tableDataRead"]
-            return True
-        except (KeyError, TypeError):
-            return False
+        return _has_nested_key(entry.payload, "metadata", "tableDataRead")
 
     @classmethod
     def from_entry(cls, entry: AuditLogEntry) -> "ReadEvent":
-        user = entry.payload["authenticationInfo"]["principalEmail"]
-        resourceName = entry.payload["resourceName"]
-        readInfo = entry.payload["metadata"]["tableDataRead"]
+        payload = entry.payload
+
+        # The same users, projects, and datasets show up across a large number of
+        # log entries, so we intern these strings to avoid keeping many copies around.
+        user = sys.intern(payload["authenticationInfo"]["principalEmail"])
+        resourceName = payload["resourceName"]
+        readInfo = payload["metadata"]["tableDataRead"]
 
         fields = readInfo.get("fields", [])
         readReason = readInfo.get("reason")
+        if readReason is not None:
+            readReason = sys.intern(readReason)
         jobName = None
         if readReason == "JOB":
             jobName = readInfo["jobName"]
@@ -156,13 +208,24 @@ class ReadEvent:
             fieldsRead=fields,
             readReason=readReason,
             jobName=jobName,
-            payload=entry.payload if DEBUG_INCLUDE_FULL_PAYLOADS else None,
+            payload=payload if DEBUG_INCLUDE_FULL_PAYLOADS else None,
+            query=None,
         )
         return readEvent
 
 
 @dataclass
 class QueryEvent:
+    __slots__ = (
+        "timestamp",
+        "actor_email",
+        "query",
+        "destinationTable",
+        "referencedTables",
+        "jobName",
+        "payload",
+    )
+
     timestamp: datetime
     actor_email: str
 
@@ -175,21 +238,20 @@ class QueryEvent:
 
     @classmethod
     def can_parse_entry(cls, entry: AuditLogEntry) -> bool:
-        try:
-            entry.payload["serviceData"]["jobCompletedEvent"]["job"]
-            return True
-        except (KeyError, TypeError):
-            return False
+        return _has_nested_key(entry.payload, "serviceData", "jobCompletedEvent", "job")
 
     @classmethod
     def from_entry(cls, entry: AuditLogEntry) -> "QueryEvent":
-        user = entry.payload["authenticationInfo"]["principalEmail"]
+        payload = entry.payload
+
+        user = sys.intern(payload["authenticationInfo"]["principalEmail"])
 
-        job = entry.payload["serviceData"]["jobCompletedEvent"]["job"]
+        job = payload["serviceData"]["jobCompletedEvent"]["job"]
         jobName = _job_name_ref(job["jobName"]["projectId"], job["jobName"]["jobId"])
-        rawQuery = job["jobConfiguration"]["query"]["query"]
+        queryConfig = job["jobConfiguration"]["query"]
+        rawQuery = sys.intern(queryConfig["query"])
 
-        rawDestTable = job["jobConfiguration"]["query"]["destinationTable"]
+        rawDestTable = queryConfig["destinationTable"]
         destinationTable = None
         if rawDestTable:
             destinationTable = BigQueryTableRef.from_spec_obj(rawDestTable)
@@ -208,7 +270,7 @@ class QueryEvent:
             destinationTable=destinationTable,
             referencedTables=referencedTables,
             jobName=jobName,
-            payload=entry.payload if DEBUG_INCLUDE_FULL_PAYLOADS else None,
+            payload=payload if DEBUG_INCLUDE_FULL_PAYLOADS else None,
         )
         return queryEvent
 
@@ -218,6 +280,8 @@ class BigQueryUsageConfig(BaseUsageConfig):
     extra_client_options: dict = {}
     env: str = builder.DEFAULT_ENV
 
+    # No longer used, since query events are now loaded before the read events.
+    # Retained so that existing recipes remain valid.
     query_log_delay: pydantic.PositiveInt = 100
 
 
@@ -234,6 +298,8 @@ class BigQueryUsageSource(Source):
     report: BigQueryUsageSourceReport
 
     client: GCPLoggingClient
+    query_log_filter: str
+    read_log_filter: str
 
     def __init__(self, config: BigQueryUsageConfig, ctx: PipelineContext):
         super().__init__(ctx)
@@ -248,33 +314,54 @@ class BigQueryUsageSource(Source):
         # why we disable gRPC here.
         self.client = GCPLoggingClient(**client_options, _use_grpc=False)
 
+        # The time window is fixed by the config, so the filters only need to be built once.
+        self.query_log_filter = self._make_log_filter(BQ_QUERY_EVENT_FILTER)
+        self.read_log_filter = self._make_log_filter(BQ_READ_EVENT_FILTER)
+
+    def _make_log_filter(self, event_filter: str) -> str:
+        return BQ_FILTER_RULE_TEMPLATE.format(
+            event_filter=event_filter,
+            start_time=self.config.start_time.strftime(BQ_DATETIME_FORMAT),
+            end_time=self.config.end_time.strftime(BQ_DATETIME_FORMAT),
+        )
+
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "BigQueryUsageSource":
         config = BigQueryUsageConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
     def get_workunits(self) -> Iterable[UsageStatsWorkUnit]:
-        bigquery_log_entries = self._get_bigquery_log_entries()
-        parsed_events = self._parse_bigquery_log_entries(bigquery_log_entries)
-        hydrated_read_events = self._join_events_by_job_id(parsed_events)
+        # We make two passes over the logs. The first collects the query for each job,
+        # which the second then joins into the table read events. This way, the join
+        # does not depend on the order in which events appear in the logs.
+        query_log_entries = self._get_bigquery_log_entries(self.query_log_filter)
+        query_events = self._parse_bigquery_log_entries(query_log_entries)
+        job_queries = self._collect_job_queries(query_events)
+
+        read_log_entries = self._get_bigquery_log_entries(self.read_log_filter)
+        read_events = self._parse_bigquery_log_entries(read_log_entries)
+        hydrated_read_events = self._join_events_by_job_id(read_events, job_queries)
         aggregated_info = self._aggregate_enriched_read_events(hydrated_read_events)
 
-        for time_bucket in aggregated_info.values():
-            for aggregate in time_bucket.values():
-                wu = self._make_usage_stat(aggregate)
-                self.report.report_workunit(wu)
-                yield wu
-
-    def _get_bigquery_log_entries(self) -> Iterable[AuditLogEntry]:
-        filter = BQ_FILTER_RULE_TEMPLATE.format(
-            start_time=self.config.start_time.strftime(BQ_DATETIME_FORMAT),
-            end_time=self.config.end_time.strftime(BQ_DATETIME_FORMAT),
+        # Release each aggregate once it has been turned into a workunit, so that we
+        # don't hold onto the raw counts for everything that has already been emitted.
+        for key in list(aggregated_info.keys()):
+            aggregate = aggregated_info.pop(key)
+            wu = self._make_usage_stat(aggregate)
+            self.report.report_workunit(wu)
+            yield wu
+
+    def _get_bigquery_log_entries(self, log_filter: str) -> Iterable[AuditLogEntry]:
+        # Fetch the next page of entries in the background while we process this one.
+        entries = prefetch_iter(
+            self.client.list_entries(
+                filter_=log_filter, page_size=GCP_LOGGING_PAGE_SIZE
+            ),
+            GCP_LOGGING_PAGE_SIZE,
         )
 
         entry: AuditLogEntry
-        for i, entry in enumerate(
-            self.client.list_entries(filter_=filter, page_size=GCP_LOGGING_PAGE_SIZE)
-        ):
+        for i, entry in enumerate(entries):
             if i == 0:
                 logger.debug("starting log load from BigQuery")
             yield entry
@@ -297,71 +384,75 @@ class BigQueryUsageSource(Source):
             if event:
                 yield event
 
-    def _join_events_by_job_id(
+    def _collect_job_queries(
         self, events: Iterable[Union[ReadEvent, QueryEvent]]
-    ) -> Iterable[ReadEvent]:
-        # We only store the most recently used query events, which are used when
-        # resolving job information within the read events.
-        query_jobs: cachetools.LRUCache[str, QueryEvent] = cachetools.LRUCache(
-            maxsize=2 * self.config.query_log_delay
-        )
+    ) -> Dict[str, str]:
+        # We only keep the query text, rather than the full query event.
+        job_queries: Dict[str, str] = {}
+        for event in events:
+            if isinstance(event, QueryEvent):
+                job_queries[sys.intern(event.jobName)] = event.query
+        return job_queries
 
-        def event_processor(
-            events: Iterable[Union[ReadEvent, QueryEvent]]
-        ) -> Iterable[ReadEvent]:
-            for event in events:
-                if isinstance(event, QueryEvent):
-                    query_jobs[event.jobName] = event
-                else:
-                    yield event
-
-        # TRICKY: To account for the possibility that the query event arrives after
-        # the read event in the audit logs, we wait for at least `query_log_delay`
-        # additional events to be processed before attempting to resolve BigQuery
-        # job information from the logs.
-        original_read_events = event_processor(events)
-        delayed_read_events = delayed_iter(
-            original_read_events, self.config.query_log_delay
-        )
+    def _join_events_by_job_id(
+        self,
+        events: Iterable[Union[ReadEvent, QueryEvent]],
+        job_queries: Dict[str, str],
+    ) -> Iterable[ReadEvent]:
+        for event in events:
+            if not isinstance(event, ReadEvent):
+                continue
 
-        for event in delayed_read_events:
             if event.jobName:
-                if event.jobName in query_jobs:
+                query = job_queries.get(event.jobName)
+                if query is not None:
                     # Join the query log event into the table read log event.
-                    event.query = query_jobs[event.jobName].query
+                    event.query = query
 
                     # TODO also join into the query itself for column references
                 else:
                     self.report.report_warning(
                         "<general>",
-                        "failed to match table read event with job; try increasing `query_log_delay`",
+                        "failed to match table read event with job",
                     )
 
             yield event
 
     def _aggregate_enriched_read_events(
         self, events: Iterable[ReadEvent]
-    ) -> Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]]:
+    ) -> Dict[Tuple[datetime, BigQueryTableRef], AggregatedDataset]:
         # TODO: handle partitioned tables
 
         # TODO: perhaps we need to continuously prune this, rather than
         # storing it all in one big object.
-        datasets: Dict[
-            datetime, Dict[BigQueryTableRef, AggregatedDataset]
-        ] = collections.defaultdict(dict)
+        # Keyed by (time bucket, table) so that each event needs only a single lookup.
+        datasets: Dict[Tuple[datetime, BigQueryTableRef], AggregatedDataset] = {}
+
+        bucket_duration = self.config.bucket_duration
+        bucket_delta = get_bucket_duration_delta(bucket_duration)
+        # The [start, end) range of the most recently computed time bucket.
+        bucket: Optional[Tuple[datetime, datetime]] = None
 
         for event in events:
-            floored_ts = get_time_bucket(event.timestamp, self.config.bucket_duration)
+            # Consecutive events almost always fall into the same bucket, so we only
+            # need to compute a new one once an event crosses the bucket boundary.
+            if bucket is None or not (bucket[0] <= event.timestamp < bucket[1]):
+                bucket_start = get_time_bucket(event.timestamp, bucket_duration)
+                bucket = (bucket_start, bucket_start + bucket_delta)
+            floored_ts = bucket[0]
             resource = event.resource.remove_extras()
 
             if resource.is_anonymous():
                 self.report.report_dropped(str(resource))
                 continue
 
-            agg_bucket = datasets[floored_ts].setdefault(
-                resource,
-                AggregatedDataset(bucket_start_time=floored_ts, resource=resource),
-            )
+            key = (floored_ts, resource)
+            agg_bucket = datasets.get(key)
+            if agg_bucket is None:
+                agg_bucket = AggregatedDataset(
+                    bucket_start_time=floored_ts, resource=resource
+                )
+                datasets[key] = agg_bucket
             agg_bucket.add_read_entry(event.actor_email, event.query, event.fieldsRead)
 
         return datasets
@@ -1,8 +1,9 @@
-import collections
 import dataclasses
 import enum
+import heapq
+import operator
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Counter, Generic, List, Optional, TypeVar
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 import pydantic
 
@@ -40,6 +41,16 @@ def get_bucket_duration_delta(bucketing: BucketDuration) -> timedelta:
         return timedelta(days=1)
 
 
+def _sorted_by_count(
+    freq: Dict[str, int], limit: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    # Same ordering as Counter.most_common(), including for ties.
+    if limit is not None:
+        # Cheaper than a full sort when we only need the top few entries.
+        return heapq.nlargest(limit, freq.items(), key=operator.itemgetter(1))
+    return sorted(freq.items(), key=operator.itemgetter(1), reverse=True)
+
+
 ResourceType = TypeVar("ResourceType")
 
 
@@ -50,20 +61,23 @@ class GenericAggregatedDataset(Generic[ResourceType]):
 
     readCount: int = 0
     queryCount: int = 0
-    queryFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
-    userFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
-    columnFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    # These are plain dicts rather than Counters, since incrementing a Counter is
+    # noticeably slower and add_read_entry is called for every single event.
+    queryFreq: Dict[str, int] = dataclasses.field(default_factory=dict)
+    userFreq: Dict[str, int] = dataclasses.field(default_factory=dict)
+    columnFreq: Dict[str, int] = dataclasses.field(default_factory=dict)
 
     def add_read_entry(
         self, user: str, query: Optional[str], fields: List[str]
     ) -> None:
         self.readCount += 1
-        self.userFreq[user] += 1
+        self.userFreq[user] = self.userFreq.get(user, 0) + 1
         if query:
             self.queryCount += 1
-            self.queryFreq[query] += 1
+            self.queryFreq[query] = self.queryFreq.get(query, 0) + 1
+        columnFreq = self.columnFreq
         for column in fields:
-            self.columnFreq[column] += 1
+            columnFreq[column] = columnFreq.get(column, 0) + 1
 
     def make_usage_workunit(
         self,
@@ -85,18 +99,19 @@ class GenericAggregatedDataset(Generic[ResourceType]):
                             count=count,
                             userEmail=user_email,
                         )
-                        for user_email, count in self.userFreq.most_common()
+                        for user_email, count in _sorted_by_count(self.userFreq)
                     ],
                     totalSqlQueries=self.queryCount,
                     topSqlQueries=[
-                        query for query, _ in self.queryFreq.most_common(top_n_queries)
+                        query
+                        for query, _ in _sorted_by_count(self.queryFreq, top_n_queries)
                     ],
                     fields=[
                         FieldUsageCountsClass(
                             fieldName=column,
                             count=count,
                         )
-                        for column, count in self.columnFreq.most_common()
+                        for column, count in _sorted_by_count(self.columnFreq)
                     ],
                 ),
             ),
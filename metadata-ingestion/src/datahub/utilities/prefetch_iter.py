@@ -0,0 +1,57 @@
+import queue
+import threading
+from typing import Any, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_END = object()
+
+
+def prefetch_iter(iterable: Iterable[T], buffer_size: int) -> Iterable[T]:
+    """Materializes elements from the source iterator on a background thread,
+    staying up to `buffer_size` elements ahead of the consumer.
+
+    This lets slow I/O within the source iterator (e.g. fetching the next page
+    from a paginated API) overlap with processing of the elements already fetched.
+    Any exception raised by the source iterator is re-raised to the consumer.
+    """
+
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(
+        maxsize=buffer_size
+    )
+    stopped = threading.Event()
+
+    def put(item: Any, error: Optional[BaseException] = None) -> bool:
+        # Periodically check whether the consumer has gone away, so that we don't
+        # block forever on a full buffer.
+        while not stopped.is_set():
+            try:
+                buffer.put((item, error), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producer() -> None:
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_END, e)
+        else:
+            put(_END)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                break
+            yield item
+    finally:
+        stopped.set()
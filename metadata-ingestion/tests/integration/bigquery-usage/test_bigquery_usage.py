@@ -1,12 +1,16 @@
+import copy
 import pathlib
+import pickle
 import unittest.mock
 from datetime import datetime, timedelta, timezone
 
 import jsonpickle
+import pytest
 
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.run.pipeline import Pipeline
 from datahub.ingestion.source.bigquery_usage import (
+    BigQueryTableRef,
     BigQueryUsageConfig,
     BigQueryUsageSource,
 )
@@ -25,6 +29,36 @@ def test_config_time_defaults():
     assert (config.end_time - config.start_time) == timedelta(hours=1)
 
 
+def test_table_ref_remove_extras():
+    assert BigQueryTableRef("p", "d", "events_20210101").remove_extras() == (
+        BigQueryTableRef("p", "d", "events")
+    )
+    assert BigQueryTableRef("p", "d", "events_2021").remove_extras() == (
+        BigQueryTableRef("p", "d", "events")
+    )
+    assert BigQueryTableRef("p", "d", "events_21").remove_extras() == (
+        BigQueryTableRef("p", "d", "events_21")
+    )
+    assert BigQueryTableRef("p", "d", "events_20210101_v2").remove_extras() == (
+        BigQueryTableRef("p", "d", "events_20210101_v2")
+    )
+    with pytest.raises(ValueError):
+        BigQueryTableRef("p", "d", "events$20210101").remove_extras()
+
+
+def test_table_ref_copy_and_pickle():
+    ref = BigQueryTableRef("p", "d", "t")
+
+    for copied in [
+        copy.copy(ref),
+        copy.deepcopy(ref),
+        pickle.loads(pickle.dumps(ref)),
+    ]:
+        assert copied == ref
+        assert hash(copied) == hash(ref)
+        assert str(copied) == "projects/p/datasets/d/tables/t"
+
+
 def test_bq_usage_source(pytestconfig, tmp_path):
     # from google.cloud.logging_v2 import ProtobufEntry
 
@@ -41,7 +75,10 @@ def test_bq_usage_source(pytestconfig, tmp_path):
             ),
             PipelineContext(run_id="bq-usage-test"),
         )
-        entries = list(source._get_bigquery_log_entries())
+        entries = [
+            *source._get_bigquery_log_entries(source.query_log_filter),
+            *source._get_bigquery_log_entries(source.read_log_filter),
+        ]
 
         entries = [entry._replace(logger=None) for entry in entries]
         log_entries = jsonpickle.encode(entries, indent=4)
@@ -73,3 +73,12 @@ def test_load(pytestconfig, filename, golden_config, env, error_type):
         else:
             loaded_config = load_config_file(filepath)
             assert loaded_config == golden_config
+
+
+def test_load_returns_copy(pytestconfig):
+    filepath = pytestconfig.rootpath / "tests/unit/config/basic.yml"
+
+    loaded_config = load_config_file(filepath)
+    loaded_config["nested"]["array"].append("three")
+
+    assert load_config_file(filepath)["nested"]["array"] == ["one", "two"]
@@ -1,5 +1,14 @@
+from typing import Dict, List, Optional
+from unittest import mock
+
+import pytest
 from click.testing import CliRunner
 
+from datahub.cli.docker_check import (
+    ENSURE_EXIT_SUCCESS,
+    REQUIRED_CONTAINERS,
+    _check_datahub_containers,
+)
 from datahub.entrypoints import datahub
 
 
@@ -22,3 +31,66 @@ def test_check_local_docker():
     runner = CliRunner()
     result = runner.invoke(datahub, ["check", "local-docker"])
     assert result.output
+
+
+def _mock_docker_client(statuses: Dict[str, Optional[str]]) -> mock.MagicMock:
+    """Builds a client listing all required containers in a healthy state,
+    with the given per-container statuses applied on top. A status of None
+    removes that container from the listing."""
+
+    containers: List[dict] = []
+    for name in sorted(REQUIRED_CONTAINERS):
+        if name in ENSURE_EXIT_SUCCESS:
+            status: Optional[str] = "Exited (0) 2 minutes ago"
+        else:
+            status = "Up 2 minutes (healthy)"
+        status = statuses.get(name, status)
+        if status is None:
+            continue
+
+        state = "exited" if status.startswith("Exited") else "running"
+        containers.append({"Names": [f"/{name}"], "State": state, "Status": status})
+
+    client = mock.MagicMock()
+    client.api.containers.return_value = containers
+    return client
+
+
+@pytest.mark.parametrize(
+    "statuses,expected_issues",
+    [
+        ({}, []),
+        ({"datahub-gms": "Up 2 minutes (healthy)"}, []),
+        (
+            {"datahub-gms": "Up 5 seconds (health: starting)"},
+            ["datahub-gms is still starting"],
+        ),
+        (
+            {"datahub-gms": "Up 1 minute (unhealthy)"},
+            ["datahub-gms is running but not healthy"],
+        ),
+        # Containers without a health check don't report any health status.
+        ({"zookeeper": "Up 3 minutes"}, []),
+        ({"datahub-gms": "Exited (137) 1 minute ago"}, ["datahub-gms is not running"]),
+        ({"kafka-setup": "Exited (0) 1 minute ago"}, []),
+        (
+            {"kafka-setup": "Exited (1) 1 minute ago"},
+            ["kafka-setup did not exit cleanly"],
+        ),
+        ({"kafka-setup": "Up 10 seconds"}, ["kafka-setup is still running"]),
+        ({"mysql": None}, ["mysql container is not present"]),
+    ],
+)
+def test_check_datahub_containers(statuses, expected_issues):
+    client = _mock_docker_client(statuses)
+
+    assert _check_datahub_containers(client) == expected_issues
+
+
+def test_check_datahub_containers_none_running():
+    client = mock.MagicMock()
+    client.api.containers.return_value = []
+
+    assert _check_datahub_containers(client) == [
+        "quickstart.sh or dev.sh is not running"
+    ]
@@ -1,30 +1,59 @@
 from datetime import datetime, timezone
+from typing import Any, Dict
+
+# Timestamps are shared between stubs rather than rebuilt at every use.
+default_time = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+feature_group_1_creation_time = datetime(2021, 6, 24, 9, 48, 37, 35000)
+feature_group_2_creation_time = datetime(2021, 6, 23, 13, 58, 10, 264000)
+feature_group_3_creation_time = datetime(2021, 6, 14, 11, 3, 0, 803000)
+
+arn_prefix = "arn:aws:sagemaker:us-west-2:123412341234:"
+
+execution_role_arn = "arn:aws:iam::123412341234:role/service-role/AmazonSageMaker-ExecutionRole-20210614T104201"
+job_role_arn = "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole"
+
+# Sub-structures that recur across stubs are defined once and shared.
+vpc_config = {
+    "SecurityGroupIds": [
+        "string",
+    ],
+    "Subnets": [
+        "string",
+    ],
+}
+stopping_condition = {"MaxRuntimeInSeconds": 123, "MaxWaitTimeInSeconds": 123}
+experiment_config = {
+    "ExperimentName": "string",
+    "TrialName": "string",
+    "TrialComponentDisplayName": "string",
+}
 
 list_feature_groups_response = {
     "FeatureGroupSummaries": [
         {
             "FeatureGroupName": "test-2",
-            "FeatureGroupArn": "arn:aws:sagemaker:us-west-2:123412341234:feature-group/test-2",
-            "CreationTime": datetime(2021, 6, 24, 9, 48, 37, 35000),
+            "FeatureGroupArn": f"{arn_prefix}feature-group/test-2",
+            "CreationTime": feature_group_1_creation_time,
             "FeatureGroupStatus": "Created",
         },
         {
             "FeatureGroupName": "test-1",
-            "FeatureGroupArn": "arn:aws:sagemaker:us-west-2:123412341234:feature-group/test-1",
-            "CreationTime": datetime(2021, 6, 23, 13, 58, 10, 264000),
+            "FeatureGroupArn": f"{arn_prefix}feature-group/test-1",
+            "CreationTime": feature_group_2_creation_time,
             "FeatureGroupStatus": "Created",
         },
         {
             "FeatureGroupName": "test",
-            "FeatureGroupArn": "arn:aws:sagemaker:us-west-2:123412341234:feature-group/test",
-            "CreationTime": datetime(2021, 6, 14, 11, 3, 0, 803000),
+            "FeatureGroupArn": f"{arn_prefix}feature-group/test",
+            "CreationTime": feature_group_3_creation_time,
             "FeatureGroupStatus": "Created",
         },
     ],
     "NextToken": "",
 }
 describe_feature_group_response_1 = {
-    "FeatureGroupArn": "arn:aws:sagemaker:us-west-2:123412341234:feature-group/test-2",
+    "FeatureGroupArn": f"{arn_prefix}feature-group/test-2",
     "FeatureGroupName": "test-2",
     "RecordIdentifierFeatureName": "some-feature-2",
     "EventTimeFeatureName": "some-feature-3",
@@ -33,7 +62,7 @@ describe_feature_group_response_1 = {
         {"FeatureName": "some-feature-2", "FeatureType": "Integral"},
         {"FeatureName": "some-feature-3", "FeatureType": "Fractional"},
     ],
-    "CreationTime": datetime(2021, 6, 24, 9, 48, 37, 35000),
+    "CreationTime": feature_group_1_creation_time,
     "OnlineStoreConfig": {"EnableOnlineStore": True},
     "OfflineStoreConfig": {
         "S3StorageConfig": {
@@ -47,13 +76,13 @@ describe_feature_group_response_1 = {
             "Database": "sagemaker_featurestore",
         },
     },
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMaker-ExecutionRole-20210614T104201",
+    "RoleArn": execution_role_arn,
     "FeatureGroupStatus": "Created",
     "Description": "Yet another test feature group",
     "NextToken": "",
 }
 describe_feature_group_response_2 = {
-    "FeatureGroupArn": "arn:aws:sagemaker:us-west-2:123412341234:feature-group/test-1",
+    "FeatureGroupArn": f"{arn_prefix}feature-group/test-1",
     "FeatureGroupName": "test-1",
     "RecordIdentifierFeatureName": "id",
     "EventTimeFeatureName": "time",
@@ -63,14 +92,14 @@ describe_feature_group_response_2 = {
         {"FeatureName": "height", "FeatureType": "Fractional"},
         {"FeatureName": "time", "FeatureType": "String"},
     ],
-    "CreationTime": datetime(2021, 6, 23, 13, 58, 10, 264000),
+    "CreationTime": feature_group_2_creation_time,
     "OnlineStoreConfig": {"EnableOnlineStore": True},
     "FeatureGroupStatus": "Created",
     "Description": "First test feature group",
     "NextToken": "",
 }
 describe_feature_group_response_3 = {
-    "FeatureGroupArn": "arn:aws:sagemaker:us-west-2:123412341234:feature-group/test",
+    "FeatureGroupArn": f"{arn_prefix}feature-group/test",
     "FeatureGroupName": "test",
     "RecordIdentifierFeatureName": "feature_1",
     "EventTimeFeatureName": "feature_3",
@@ -79,22 +108,14 @@ describe_feature_group_response_3 = {
         {"FeatureName": "feature_2", "FeatureType": "Integral"},
         {"FeatureName": "feature_3", "FeatureType": "Fractional"},
     ],
-    "CreationTime": datetime(
-        2021,
-        6,
-        14,
-        11,
-        3,
-        0,
-        803000,
-    ),
+    "CreationTime": feature_group_3_creation_time,
     "OnlineStoreConfig": {"EnableOnlineStore": True},
     "FeatureGroupStatus": "Created",
     "NextToken": "",
 }
 
 auto_ml_job_name = "an-auto-ml-job"
-auto_ml_job_arn = "arn:aws:sagemaker:us-west-2:123412341234:auto-ml-job/an-auto-ml-job"
+auto_ml_job_arn = f"{arn_prefix}auto-ml-job/{auto_ml_job_name}"
 list_auto_ml_jobs_response = {
     "AutoMLJobSummaries": [
         {
@@ -102,9 +123,9 @@ list_auto_ml_jobs_response = {
             "AutoMLJobArn": auto_ml_job_arn,
             "AutoMLJobStatus": "Completed",
             "AutoMLJobSecondaryStatus": "Starting",
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "EndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "EndTime": default_time,
+            "LastModifiedTime": default_time,
             "FailureReason": "string",
             "PartialFailureReasons": [
                 {"PartialFailureMessage": "string"},
@@ -131,7 +152,7 @@ describe_auto_ml_job_response = {
         "KmsKeyId": "some-key-id",
         "S3OutputPath": "s3://auto-ml-job-output-bucket/file.txt",
     },
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
+    "RoleArn": job_role_arn,
     "AutoMLJobObjective": {
         "MetricName": "Accuracy",  # 'Accuracy'|'MSE'|'F1'|'F1macro'|'AUC'
     },
@@ -145,19 +166,12 @@ describe_auto_ml_job_response = {
         "SecurityConfig": {
             "VolumeKmsKeyId": "string",
             "EnableInterContainerTrafficEncryption": True,  # True|False
-            "VpcConfig": {
-                "SecurityGroupIds": [
-                    "string",
-                ],
-                "Subnets": [
-                    "string",
-                ],
-            },
+            "VpcConfig": vpc_config,
         },
     },
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "EndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "CreationTime": default_time,
+    "EndTime": default_time,
+    "LastModifiedTime": default_time,
     "FailureReason": "string",
     "PartialFailureReasons": [
         {"PartialFailureMessage": "string"},
@@ -193,9 +207,9 @@ describe_auto_ml_job_response = {
                 "Environment": {"string": "string"},
             },
         ],
-        "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "EndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+        "CreationTime": default_time,
+        "EndTime": default_time,
+        "LastModifiedTime": default_time,
         "FailureReason": "string",
         "CandidateProperties": {
             "CandidateArtifactLocations": {"Explainability": "string"}
@@ -245,22 +259,20 @@ describe_auto_ml_job_response = {
 }
 
 compilation_job_name = "a-compilation-job"
-compilation_job_arn = (
-    "arn:aws:sagemaker:us-west-2:123412341234:compilation-job/a-compilation-job"
-)
+compilation_job_arn = f"{arn_prefix}compilation-job/{compilation_job_name}"
 list_compilation_jobs_response = {
     "CompilationJobSummaries": [
         {
             "CompilationJobName": compilation_job_name,
             "CompilationJobArn": compilation_job_arn,
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "CompilationStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "CompilationEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "CompilationStartTime": default_time,
+            "CompilationEndTime": default_time,
             "CompilationTargetDevice": "lambda",
             "CompilationTargetPlatformOs": "ANDROID",
             "CompilationTargetPlatformArch": "X86_64",
             "CompilationTargetPlatformAccelerator": "INTEL_GRAPHICS",
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "LastModifiedTime": default_time,
             "CompilationJobStatus": "INPROGRESS",
         },
     ],
@@ -269,18 +281,18 @@ describe_compilation_job_response = {
     "CompilationJobName": compilation_job_name,
     "CompilationJobArn": compilation_job_arn,
     "CompilationJobStatus": "INPROGRESS",  # 'INPROGRESS'|'COMPLETED'|'FAILED'|'STARTING'|'STOPPING'|'STOPPED'
-    "CompilationStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "CompilationEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "StoppingCondition": {"MaxRuntimeInSeconds": 123, "MaxWaitTimeInSeconds": 123},
+    "CompilationStartTime": default_time,
+    "CompilationEndTime": default_time,
+    "StoppingCondition": stopping_condition,
     "InferenceImage": "string",
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "CreationTime": default_time,
+    "LastModifiedTime": default_time,
     "FailureReason": "string",
     "ModelArtifacts": {
         "S3ModelArtifacts": "s3://compilation-job-bucket/model-artifacts.tar.gz"
     },
     "ModelDigests": {"ArtifactDigest": "string"},
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
+    "RoleArn": job_role_arn,
     "InputConfig": {
         "S3Uri": "s3://compilation-job-bucket/input-config.tar.gz",
         "DataInputConfig": "string",
@@ -298,20 +310,11 @@ describe_compilation_job_response = {
         "CompilerOptions": "string",
         "KmsKeyId": "string",
     },
-    "VpcConfig": {
-        "SecurityGroupIds": [
-            "string",
-        ],
-        "Subnets": [
-            "string",
-        ],
-    },
+    "VpcConfig": vpc_config,
 }
 
 edge_packaging_job_name = "an-edge-packaging-job"
-edge_packaging_job_arn = (
-    "arn:aws:sagemaker:us-west-2:123412341234:edge-packaging-job/an-edge-packaging-job"
-)
+edge_packaging_job_arn = f"{arn_prefix}edge-packaging-job/{edge_packaging_job_name}"
 list_edge_packaging_jobs_response = {
     "EdgePackagingJobSummaries": [
         {
@@ -321,8 +324,8 @@ list_edge_packaging_jobs_response = {
             "CompilationJobName": "string",
             "ModelName": "string",
             "ModelVersion": "string",
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "LastModifiedTime": default_time,
         },
     ],
 }
@@ -332,7 +335,7 @@ describe_edge_packaging_job_response = {
     "CompilationJobName": compilation_job_name,
     "ModelName": "string",
     "ModelVersion": "string",
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
+    "RoleArn": job_role_arn,
     "OutputConfig": {
         "S3OutputLocation": "s3://edge-packaging-bucket/output-config.tar.gz",
         "KmsKeyId": "string",
@@ -342,20 +345,31 @@ describe_edge_packaging_job_response = {
     "ResourceKey": "string",
     "EdgePackagingJobStatus": "STARTING",  # 'STARTING'|'INPROGRESS'|'COMPLETED'|'FAILED'|'STOPPING'|'STOPPED'
     "EdgePackagingJobStatusMessage": "string",
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "CreationTime": default_time,
+    "LastModifiedTime": default_time,
     "ModelArtifact": "s3://edge-packaging-bucket/model-artifact.tar.gz",
     "ModelSignature": "string",
     "PresetDeploymentOutput": {
         "Type": "GreengrassV2Component",
-        "Artifact": "arn:aws:sagemaker:us-west-2:123412341234:edge-packaging-job/some-artifact",
+        "Artifact": f"{arn_prefix}edge-packaging-job/some-artifact",
         "Status": "COMPLETED",  # 'COMPLETED'|'FAILED'
         "StatusMessage": "string",
     },
 }
 
+training_job_status_counters = {
+    "Completed": 123,
+    "InProgress": 123,
+    "RetryableError": 123,
+    "NonRetryableError": 123,
+    "Stopped": 123,
+}
+objective_status_counters = {"Succeeded": 123, "Pending": 123, "Failed": 123}
+
 hyper_parameter_tuning_job_name = "a-hyper-parameter-tuning-job"
-hyper_parameter_tuning_job_arn = "arn:aws:sagemaker:us-west-2:123412341234:hyper-parameter-tuning-job/a-hyper-parameter-tuning-job"
+hyper_parameter_tuning_job_arn = (
+    f"{arn_prefix}hyper-parameter-tuning-job/{hyper_parameter_tuning_job_name}"
+)
 list_hyper_parameter_tuning_jobs_response = {
     "HyperParameterTuningJobSummaries": [
         {
@@ -363,21 +377,11 @@ list_hyper_parameter_tuning_jobs_response = {
             "HyperParameterTuningJobArn": hyper_parameter_tuning_job_arn,
             "HyperParameterTuningJobStatus": "Completed",
             "Strategy": "Bayesian",
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "HyperParameterTuningEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "TrainingJobStatusCounters": {
-                "Completed": 123,
-                "InProgress": 123,
-                "RetryableError": 123,
-                "NonRetryableError": 123,
-                "Stopped": 123,
-            },
-            "ObjectiveStatusCounters": {
-                "Succeeded": 123,
-                "Pending": 123,
-                "Failed": 123,
-            },
+            "CreationTime": default_time,
+            "HyperParameterTuningEndTime": default_time,
+            "LastModifiedTime": default_time,
+            "TrainingJobStatusCounters": training_job_status_counters,
+            "ObjectiveStatusCounters": objective_status_counters,
             "ResourceLimits": {
                 "MaxNumberOfTrainingJobs": 123,
                 "MaxParallelTrainingJobs": 123,
@@ -385,293 +389,141 @@ list_hyper_parameter_tuning_jobs_response = {
         },
     ],
 }
-describe_hyper_parameter_tuning_job_response = {
-    "HyperParameterTuningJobName": hyper_parameter_tuning_job_name,
-    "HyperParameterTuningJobArn": hyper_parameter_tuning_job_arn,
-    "HyperParameterTuningJobConfig": {
-        "Strategy": "Bayesian",  # 'Bayesian'|'Random'
-        "HyperParameterTuningJobObjective": {
-            "Type": "Maximize",  # 'Maximize'|'Minimize'
-            "MetricName": "string",
+hyper_parameter_ranges = {
+    "IntegerParameterRanges": [
+        {
+            "Name": "string",
+            "MinValue": "string",
+            "MaxValue": "string",
+            "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
         },
-        "ResourceLimits": {
-            "MaxNumberOfTrainingJobs": 123,
-            "MaxParallelTrainingJobs": 123,
+    ],
+    "ContinuousParameterRanges": [
+        {
+            "Name": "string",
+            "MinValue": "string",
+            "MaxValue": "string",
+            "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
         },
-        "ParameterRanges": {
-            "IntegerParameterRanges": [
-                {
-                    "Name": "string",
-                    "MinValue": "string",
-                    "MaxValue": "string",
-                    "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
-                },
-            ],
-            "ContinuousParameterRanges": [
-                {
-                    "Name": "string",
-                    "MinValue": "string",
-                    "MaxValue": "string",
-                    "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
-                },
-            ],
-            "CategoricalParameterRanges": [
-                {
-                    "Name": "string",
-                    "Values": [
-                        "string",
-                    ],
-                },
+    ],
+    "CategoricalParameterRanges": [
+        {
+            "Name": "string",
+            "Values": [
+                "string",
             ],
         },
-        "TrainingJobEarlyStoppingType": "Off",  # 'Off'|'Auto'
-        "TuningJobCompletionCriteria": {"TargetObjectiveMetricValue": 1.0},
+    ],
+}
+best_training_job = {
+    "TrainingJobDefinitionName": "string",
+    "TrainingJobName": "string",
+    "TrainingJobArn": "string",
+    "TuningJobName": "string",
+    "CreationTime": default_time,
+    "TrainingStartTime": default_time,
+    "TrainingEndTime": default_time,
+    "TrainingJobStatus": "InProgress",  # 'InProgress'|'Completed'|'Failed'|'Stopping'|'Stopped'
+    "TunedHyperParameters": {"string": "string"},
+    "FailureReason": "string",
+    "FinalHyperParameterTuningJobObjectiveMetric": {
+        "Type": "Maximize",  # 'Maximize'|'Minimize'
+        "MetricName": "string",
+        "Value": 1.0,
     },
-    "TrainingJobDefinition": {
-        "DefinitionName": "string",
-        "TuningObjective": {
-            "Type": "Maximize",  # "Maximize" | "Minimize"
-            "MetricName": "string",
-        },
-        "HyperParameterRanges": {
-            "IntegerParameterRanges": [
-                {
-                    "Name": "string",
-                    "MinValue": "string",
-                    "MaxValue": "string",
-                    "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
-                },
-            ],
-            "ContinuousParameterRanges": [
-                {
-                    "Name": "string",
-                    "MinValue": "string",
-                    "MaxValue": "string",
-                    "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
-                },
-            ],
-            "CategoricalParameterRanges": [
-                {
-                    "Name": "string",
-                    "Values": [
-                        "string",
-                    ],
-                },
-            ],
-        },
-        "StaticHyperParameters": {"string": "string"},
-        "AlgorithmSpecification": {
-            "TrainingImage": "string",
-            "TrainingInputMode": "Pipe",  # 'Pipe'|'File'
-            "AlgorithmName": "string",
-            "MetricDefinitions": [
-                {"Name": "string", "Regex": "string"},
-            ],
-        },
-        "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
-        "InputDataConfig": [
-            {
-                "ChannelName": "string",
-                "DataSource": {
-                    "S3DataSource": {
-                        "S3DataType": "ManifestFile",  # 'ManifestFile'|'S3Prefix'|'AugmentedManifestFile'
-                        "S3Uri": "s3://hyper-parameter-tuning-job/data-source.tar.gz",
-                        "S3DataDistributionType": "FullyReplicated",  # 'FullyReplicated'|'ShardedByS3Key'
-                        "AttributeNames": [
-                            "string",
-                        ],
-                    },
-                    "FileSystemDataSource": {
-                        "FileSystemId": "abcdefgihjklmnopqrstuvwxyz",
-                        "FileSystemAccessMode": "rw",  # 'rw'|'ro'
-                        "FileSystemType": "EFS",  # 'EFS'|'FSxLustre'
-                        "DirectoryPath": "string",
-                    },
-                },
-                "ContentType": "string",
-                "CompressionType": "None",  # 'None'|'Gzip'
-                "RecordWrapperType": "None",  # 'None'|'RecordIO'
-                "InputMode": "Pipe",  # 'Pipe'|'File'
-                "ShuffleConfig": {"Seed": 123},
-            },
+    "ObjectiveStatus": "Succeeded",  # 'Succeeded'|'Pending'|'Failed'
+}
+hyper_parameter_tuning_training_job_definition = {
+    "DefinitionName": "string",
+    "TuningObjective": {
+        "Type": "Maximize",  # "Maximize" | "Minimize"
+        "MetricName": "string",
+    },
+    "HyperParameterRanges": hyper_parameter_ranges,
+    "StaticHyperParameters": {"string": "string"},
+    "AlgorithmSpecification": {
+        "TrainingImage": "string",
+        "TrainingInputMode": "Pipe",  # 'Pipe'|'File'
+        "AlgorithmName": "string",
+        "MetricDefinitions": [
+            {"Name": "string", "Regex": "string"},
         ],
-        "VpcConfig": {
-            "SecurityGroupIds": [
-                "string",
-            ],
-            "Subnets": [
-                "string",
-            ],
-        },
-        "OutputDataConfig": {
-            "KmsKeyId": "string",
-            "S3OutputPath": "s3://hyper-parameter-tuning-job/data-output.tar.gz",
-        },
-        "ResourceConfig": {
-            "InstanceType": "ml.m4.xlarge",
-            "InstanceCount": 123,
-            "VolumeSizeInGB": 123,
-            "VolumeKmsKeyId": "string",
-        },
-        "StoppingCondition": {"MaxRuntimeInSeconds": 123, "MaxWaitTimeInSeconds": 123},
-        "EnableNetworkIsolation": True,  # True|False
-        "EnableInterContainerTrafficEncryption": True,  # True|False
-        "EnableManagedSpotTraining": True,  # True|False
-        "CheckpointConfig": {
-            "S3Uri": "s3://hyper-parameter-tuning-job/checkpoint-config.tar.gz",
-            "LocalPath": "string",
-        },
-        "RetryStrategy": {"MaximumRetryAttempts": 123},
     },
-    "TrainingJobDefinitions": [
+    "RoleArn": job_role_arn,
+    "InputDataConfig": [
         {
-            "DefinitionName": "string",
-            "TuningObjective": {
-                "Type": "Maximize",  # 'Maximize'|'Minimize'
-                "MetricName": "string",
-            },
-            "HyperParameterRanges": {
-                "IntegerParameterRanges": [
-                    {
-                        "Name": "string",
-                        "MinValue": "string",
-                        "MaxValue": "string",
-                        "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
-                    },
-                ],
-                "ContinuousParameterRanges": [
-                    {
-                        "Name": "string",
-                        "MinValue": "string",
-                        "MaxValue": "string",
-                        "ScalingType": "Auto",  # 'Auto'|'Linear'|'Logarithmic'|'ReverseLogarithmic'
-                    },
-                ],
-                "CategoricalParameterRanges": [
-                    {
-                        "Name": "string",
-                        "Values": [
-                            "string",
-                        ],
-                    },
-                ],
-            },
-            "StaticHyperParameters": {"string": "string"},
-            "AlgorithmSpecification": {
-                "TrainingImage": "string",
-                "TrainingInputMode": "Pipe",  # 'Pipe'|'File'
-                "AlgorithmName": "string",
-                "MetricDefinitions": [
-                    {"Name": "string", "Regex": "string"},
-                ],
-            },
-            "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
-            "InputDataConfig": [
-                {
-                    "ChannelName": "string",
-                    "DataSource": {
-                        "S3DataSource": {
-                            "S3DataType": "ManifestFile",  # 'ManifestFile'|'S3Prefix'|'AugmentedManifestFile'
-                            "S3Uri": "s3://hyper-parameter-tuning-job/data-source.tar.gz",
-                            "S3DataDistributionType": "FullyReplicated",  # 'FullyReplicated'|'ShardedByS3Key'
-                            "AttributeNames": [
-                                "string",
-                            ],
-                        },
-                        "FileSystemDataSource": {
-                            "FileSystemId": "abcdefgihjklmnopqrstuvwxyz",
-                            "FileSystemAccessMode": "rw",  # 'rw'|'ro'
-                            "FileSystemType": "EFS",  # 'EFS'|'FSxLustre'
-                            "DirectoryPath": "string",
-                        },
-                    },
-                    "ContentType": "string",
-                    "CompressionType": "None",  # 'None'|'Gzip'
-                    "RecordWrapperType": "None",  # 'None'|'RecordIO'
-                    "InputMode": "Pipe",  # 'Pipe'|'File'
-                    "ShuffleConfig": {"Seed": 123},
+            "ChannelName": "string",
+            "DataSource": {
+                "S3DataSource": {
+                    "S3DataType": "ManifestFile",  # 'ManifestFile'|'S3Prefix'|'AugmentedManifestFile'
+                    "S3Uri": "s3://hyper-parameter-tuning-job/data-source.tar.gz",
+                    "S3DataDistributionType": "FullyReplicated",  # 'FullyReplicated'|'ShardedByS3Key'
+                    "AttributeNames": [
+                        "string",
+                    ],
+                },
+                "FileSystemDataSource": {
+                    "FileSystemId": "abcdefgihjklmnopqrstuvwxyz",
+                    "FileSystemAccessMode": "rw",  # 'rw'|'ro'
+                    "FileSystemType": "EFS",  # 'EFS'|'FSxLustre'
+                    "DirectoryPath": "string",
                 },
-            ],
-            "VpcConfig": {
-                "SecurityGroupIds": [
-                    "string",
-                ],
-                "Subnets": [
-                    "string",
-                ],
-            },
-            "OutputDataConfig": {
-                "KmsKeyId": "string",
-                "S3OutputPath": "s3://hyper-parameter-tuning-job/data-output.tar.gz",
-            },
-            "ResourceConfig": {
-                "InstanceType": "ml.m4.xlarge",
-                "InstanceCount": 123,
-                "VolumeSizeInGB": 123,
-                "VolumeKmsKeyId": "string",
-            },
-            "StoppingCondition": {
-                "MaxRuntimeInSeconds": 123,
-                "MaxWaitTimeInSeconds": 123,
-            },
-            "EnableNetworkIsolation": True,  # True|False
-            "EnableInterContainerTrafficEncryption": True,  # True|False
-            "EnableManagedSpotTraining": True,  # True|False
-            "CheckpointConfig": {
-                "S3Uri": "s3://hyper-parameter-tuning-job/checkpoint-config.tar.gz",
-                "LocalPath": "string",
             },
-            "RetryStrategy": {"MaximumRetryAttempts": 123},
+            "ContentType": "string",
+            "CompressionType": "None",  # 'None'|'Gzip'
+            "RecordWrapperType": "None",  # 'None'|'RecordIO'
+            "InputMode": "Pipe",  # 'Pipe'|'File'
+            "ShuffleConfig": {"Seed": 123},
         },
     ],
-    "HyperParameterTuningJobStatus": "Completed",  # 'Completed'|'InProgress'|'Failed'|'Stopped'|'Stopping'
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "HyperParameterTuningEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "TrainingJobStatusCounters": {
-        "Completed": 123,
-        "InProgress": 123,
-        "RetryableError": 123,
-        "NonRetryableError": 123,
-        "Stopped": 123,
+    "VpcConfig": vpc_config,
+    "OutputDataConfig": {
+        "KmsKeyId": "string",
+        "S3OutputPath": "s3://hyper-parameter-tuning-job/data-output.tar.gz",
     },
-    "ObjectiveStatusCounters": {"Succeeded": 123, "Pending": 123, "Failed": 123},
-    "BestTrainingJob": {
-        "TrainingJobDefinitionName": "string",
-        "TrainingJobName": "string",
-        "TrainingJobArn": "string",
-        "TuningJobName": "string",
-        "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "TrainingStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "TrainingEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "TrainingJobStatus": "InProgress",  # 'InProgress'|'Completed'|'Failed'|'Stopping'|'Stopped'
-        "TunedHyperParameters": {"string": "string"},
-        "FailureReason": "string",
-        "FinalHyperParameterTuningJobObjectiveMetric": {
-            "Type": "Maximize",  # 'Maximize'|'Minimize'
-            "MetricName": "string",
-            "Value": 1.0,
-        },
-        "ObjectiveStatus": "Succeeded",  # 'Succeeded'|'Pending'|'Failed'
+    "ResourceConfig": {
+        "InstanceType": "ml.m4.xlarge",
+        "InstanceCount": 123,
+        "VolumeSizeInGB": 123,
+        "VolumeKmsKeyId": "string",
     },
-    "OverallBestTrainingJob": {
-        "TrainingJobDefinitionName": "string",
-        "TrainingJobName": "string",
-        "TrainingJobArn": "string",
-        "TuningJobName": "string",
-        "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "TrainingStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "TrainingEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        "TrainingJobStatus": "InProgress",  # 'InProgress'|'Completed'|'Failed'|'Stopping'|'Stopped'
-        "TunedHyperParameters": {"string": "string"},
-        "FailureReason": "string",
-        "FinalHyperParameterTuningJobObjectiveMetric": {
+    "StoppingCondition": stopping_condition,
+    "EnableNetworkIsolation": True,  # True|False
+    "EnableInterContainerTrafficEncryption": True,  # True|False
+    "EnableManagedSpotTraining": True,  # True|False
+    "CheckpointConfig": {
+        "S3Uri": "s3://hyper-parameter-tuning-job/checkpoint-config.tar.gz",
+        "LocalPath": "string",
+    },
+    "RetryStrategy": {"MaximumRetryAttempts": 123},
+}
+describe_hyper_parameter_tuning_job_response = {
+    "HyperParameterTuningJobName": hyper_parameter_tuning_job_name,
+    "HyperParameterTuningJobArn": hyper_parameter_tuning_job_arn,
+    "HyperParameterTuningJobConfig": {
+        "Strategy": "Bayesian",  # 'Bayesian'|'Random'
+        "HyperParameterTuningJobObjective": {
             "Type": "Maximize",  # 'Maximize'|'Minimize'
             "MetricName": "string",
-            "Value": 1.0,
         },
-        "ObjectiveStatus": "Succeeded",  # 'Succeeded'|'Pending'|'Failed'
+        "ResourceLimits": {
+            "MaxNumberOfTrainingJobs": 123,
+            "MaxParallelTrainingJobs": 123,
+        },
+        "ParameterRanges": hyper_parameter_ranges,
+        "TrainingJobEarlyStoppingType": "Off",  # 'Off'|'Auto'
+        "TuningJobCompletionCriteria": {"TargetObjectiveMetricValue": 1.0},
     },
+    "TrainingJobDefinition": hyper_parameter_tuning_training_job_definition,
+    "TrainingJobDefinitions": [hyper_parameter_tuning_training_job_definition],
+    "HyperParameterTuningJobStatus": "Completed",  # 'Completed'|'InProgress'|'Failed'|'Stopped'|'Stopping'
+    "CreationTime": default_time,
+    "HyperParameterTuningEndTime": default_time,
+    "LastModifiedTime": default_time,
+    "TrainingJobStatusCounters": training_job_status_counters,
+    "ObjectiveStatusCounters": objective_status_counters,
+    "BestTrainingJob": best_training_job,
+    "OverallBestTrainingJob": best_training_job,
     "WarmStartConfig": {
         "ParentHyperParameterTuningJobs": [
             {"HyperParameterTuningJobName": "string"},
@@ -682,16 +534,14 @@ describe_hyper_parameter_tuning_job_response = {
 }
 
 labeling_job_name = "a-labeling-job"
-labeling_job_arn = (
-    "arn:aws:sagemaker:us-west-2:123412341234:labeling-job/a-labeling-job"
-)
+labeling_job_arn = f"{arn_prefix}labeling-job/{labeling_job_name}"
 list_labeling_jobs_response = {
     "LabelingJobSummaryList": [
         {
             "LabelingJobName": labeling_job_name,
             "LabelingJobArn": labeling_job_arn,
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "LastModifiedTime": default_time,
             "LabelingJobStatus": "Initializing",
             "LabelCounters": {
                 "TotalLabeled": 123,
@@ -706,7 +556,7 @@ list_labeling_jobs_response = {
             "FailureReason": "string",
             "LabelingJobOutput": {
                 "OutputDatasetS3Uri": "s3://labeling-job/output-dataset.tar.gz",
-                "FinalActiveLearningModelArn": "arn:aws:sagemaker:us-west-2:123412341234:labeling-job/final-active-learning-model",
+                "FinalActiveLearningModelArn": f"{arn_prefix}labeling-job/final-active-learning-model",
             },
             "InputConfig": {
                 "DataSource": {
@@ -733,8 +583,8 @@ describe_labeling_job_response = {
         "Unlabeled": 123,
     },
     "FailureReason": "string",
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "CreationTime": default_time,
+    "LastModifiedTime": default_time,
     "JobReferenceCode": "string",
     "LabelingJobName": labeling_job_name,
     "LabelingJobArn": labeling_job_arn,
@@ -756,7 +606,7 @@ describe_labeling_job_response = {
         "KmsKeyId": "string",
         "SnsTopicArn": "string",
     },
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
+    "RoleArn": job_role_arn,
     "LabelCategoryConfigS3Uri": "s3://labeling-job/category-config.tar.gz",
     "StoppingConditions": {
         "MaxHumanLabeledObjectCount": 123,
@@ -764,7 +614,7 @@ describe_labeling_job_response = {
     },
     "LabelingJobAlgorithmsConfig": {
         "LabelingJobAlgorithmSpecificationArn": "string",
-        "InitialActiveLearningModelArn": "arn:aws:sagemaker:us-west-2:123412341234:labeling-job/initial-active-learning-model",
+        "InitialActiveLearningModelArn": f"{arn_prefix}labeling-job/initial-active-learning-model",
         "LabelingJobResourceConfig": {"VolumeKmsKeyId": "string"},
     },
     "HumanTaskConfig": {
@@ -793,26 +643,45 @@ describe_labeling_job_response = {
     ],
     "LabelingJobOutput": {
         "OutputDatasetS3Uri": "s3://labeling-job/output-dataset.tar.gz",
-        "FinalActiveLearningModelArn": "arn:aws:sagemaker:us-west-2:123412341234:labeling-job/final-active-learning-model",
+        "FinalActiveLearningModelArn": f"{arn_prefix}labeling-job/final-active-learning-model",
     },
 }
 
 training_job_name = "a-training-job"
-training_job_arn = (
-    "arn:aws:sagemaker:us-west-2:123412341234:training-job/a-training-job"
-)
+training_job_arn = f"{arn_prefix}training-job/{training_job_name}"
 list_training_jobs_response = {
     "TrainingJobSummaries": [
         {
             "TrainingJobName": training_job_name,
             "TrainingJobArn": training_job_arn,
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "TrainingEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "TrainingEndTime": default_time,
+            "LastModifiedTime": default_time,
             "TrainingJobStatus": "InProgress",
         },
     ],
 }
+
+
+def _make_rule_configuration(s3_output_path: str) -> Dict[str, Any]:
+    return {
+        "RuleConfigurationName": "string",
+        "LocalPath": "string",
+        "S3OutputPath": s3_output_path,
+        "RuleEvaluatorImage": "string",
+        "InstanceType": "ml.t3.medium",
+        "VolumeSizeInGB": 123,
+        "RuleParameters": {"string": "string"},
+    }
+
+
+rule_evaluation_status = {
+    "RuleConfigurationName": "string",
+    "RuleEvaluationJobArn": "string",
+    "RuleEvaluationStatus": "InProgress",  # 'InProgress'|'NoIssuesFound'|'IssuesFound'|'Error'|'Stopping'|'Stopped'
+    "StatusDetails": "string",
+    "LastModifiedTime": default_time,
+}
 describe_training_job_response = {
     "TrainingJobName": training_job_name,
     "TrainingJobArn": training_job_arn,
@@ -833,7 +702,7 @@ describe_training_job_response = {
         ],
         "EnableSageMakerMetricsTimeSeries": True,  # True|False
     },
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
+    "RoleArn": job_role_arn,
     "InputDataConfig": [
         {
             "ChannelName": "string",
@@ -870,24 +739,17 @@ describe_training_job_response = {
         "VolumeSizeInGB": 123,
         "VolumeKmsKeyId": "string",
     },
-    "VpcConfig": {
-        "SecurityGroupIds": [
-            "string",
-        ],
-        "Subnets": [
-            "string",
-        ],
-    },
-    "StoppingCondition": {"MaxRuntimeInSeconds": 123, "MaxWaitTimeInSeconds": 123},
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "TrainingStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "TrainingEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "VpcConfig": vpc_config,
+    "StoppingCondition": stopping_condition,
+    "CreationTime": default_time,
+    "TrainingStartTime": default_time,
+    "TrainingEndTime": default_time,
+    "LastModifiedTime": default_time,
     "SecondaryStatusTransitions": [
         {
             "Status": "Starting",  # 'Starting'|'LaunchingMLInstances'|'PreparingTrainingStack'|'Downloading'|'DownloadingTrainingImage'|'Training'|'Uploading'|'Stopping'|'Stopped'|'MaxRuntimeExceeded'|'Completed'|'Failed'|'Interrupted'|'MaxWaitTimeExceeded'|'Updating'|'Restarting'
-            "StartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "EndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "StartTime": default_time,
+            "EndTime": default_time,
             "StatusMessage": "string",
         },
     ],
@@ -895,7 +757,7 @@ describe_training_job_response = {
         {
             "MetricName": "string",
             "Value": 1.0,
-            "Timestamp": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "Timestamp": default_time,
         },
     ],
     "EnableNetworkIsolation": True,  # True|False
@@ -915,77 +777,39 @@ describe_training_job_response = {
             {"CollectionName": "string", "CollectionParameters": {"string": "string"}},
         ],
     },
-    "ExperimentConfig": {
-        "ExperimentName": "string",
-        "TrialName": "string",
-        "TrialComponentDisplayName": "string",
-    },
+    "ExperimentConfig": experiment_config,
     "DebugRuleConfigurations": [
-        {
-            "RuleConfigurationName": "string",
-            "LocalPath": "string",
-            "S3OutputPath": "s3://training-job/debug-rule-config.tar.gz",
-            "RuleEvaluatorImage": "string",
-            "InstanceType": "ml.t3.medium",
-            "VolumeSizeInGB": 123,
-            "RuleParameters": {"string": "string"},
-        },
+        _make_rule_configuration("s3://training-job/debug-rule-config.tar.gz")
     ],
     "TensorBoardOutputConfig": {
         "LocalPath": "string",
         "S3OutputPath": "s3://training-job/tensorboard-output-config.tar.gz",
     },
-    "DebugRuleEvaluationStatuses": [
-        {
-            "RuleConfigurationName": "string",
-            "RuleEvaluationJobArn": "string",
-            "RuleEvaluationStatus": "InProgress",  # 'InProgress'|'NoIssuesFound'|'IssuesFound'|'Error'|'Stopping'|'Stopped'
-            "StatusDetails": "string",
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        },
-    ],
+    "DebugRuleEvaluationStatuses": [rule_evaluation_status],
     "ProfilerConfig": {
         "S3OutputPath": "s3://training-job/profiler-config.tar.gz",
         "ProfilingIntervalInMilliseconds": 123,
         "ProfilingParameters": {"string": "string"},
     },
     "ProfilerRuleConfigurations": [
-        {
-            "RuleConfigurationName": "string",
-            "LocalPath": "string",
-            "S3OutputPath": "s3://training-job/profiler-rule-config.tar.gz",
-            "RuleEvaluatorImage": "string",
-            "InstanceType": "ml.t3.medium",
-            "VolumeSizeInGB": 123,
-            "RuleParameters": {"string": "string"},
-        },
-    ],
-    "ProfilerRuleEvaluationStatuses": [
-        {
-            "RuleConfigurationName": "string",
-            "RuleEvaluationJobArn": "string",
-            "RuleEvaluationStatus": "InProgress",  # 'InProgress'|'NoIssuesFound'|'IssuesFound'|'Error'|'Stopping'|'Stopped'
-            "StatusDetails": "string",
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-        },
+        _make_rule_configuration("s3://training-job/profiler-rule-config.tar.gz")
     ],
+    "ProfilerRuleEvaluationStatuses": [rule_evaluation_status],
     "ProfilingStatus": "Enabled",  # 'Enabled'|'Disabled'
     "RetryStrategy": {"MaximumRetryAttempts": 123},
     "Environment": {"string": "string"},
 }
 
 processing_job_name = "a-processing-job"
-processing_job_arn = (
-    "arn:aws:sagemaker:us-west-2:123412341234:processing-job/a-processing-job"
-)
+processing_job_arn = f"{arn_prefix}processing-job/{processing_job_name}"
 list_processing_jobs_response = {
     "ProcessingJobSummaries": [
         {
             "ProcessingJobName": processing_job_name,
             "ProcessingJobArn": processing_job_arn,
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "ProcessingEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "ProcessingEndTime": default_time,
+            "LastModifiedTime": default_time,
             "ProcessingJobStatus": "InProgress",
             "FailureReason": "string",
             "ExitMessage": "string",
@@ -1023,7 +847,7 @@ describe_processing_job_response = {
                     "Database": "redshift-database",
                     "DbUser": "redshift-db-user",
                     "QueryString": "redshift-query-string",
-                    "ClusterRoleArn": "arn:aws:sagemaker:us-west-2:123412341234:processing-job/redshift-cluster",
+                    "ClusterRoleArn": f"{arn_prefix}processing-job/redshift-cluster",
                     "OutputS3Uri": "s3://processing-job/redshift-output.tar.gz",
                     "KmsKeyId": "string",
                     "OutputFormat": "PARQUET",  # 'PARQUET'|'CSV'
@@ -1072,45 +896,32 @@ describe_processing_job_response = {
     "NetworkConfig": {
         "EnableInterContainerTrafficEncryption": True,  # True|False
         "EnableNetworkIsolation": True,  # True|False
-        "VpcConfig": {
-            "SecurityGroupIds": [
-                "string",
-            ],
-            "Subnets": [
-                "string",
-            ],
-        },
-    },
-    "RoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMakerServiceCatalogProductsUseRole",
-    "ExperimentConfig": {
-        "ExperimentName": "string",
-        "TrialName": "string",
-        "TrialComponentDisplayName": "string",
+        "VpcConfig": vpc_config,
     },
+    "RoleArn": job_role_arn,
+    "ExperimentConfig": experiment_config,
     "ProcessingJobStatus": "InProgress",  # 'InProgress'|'Completed'|'Failed'|'Stopping'|'Stopped'
     "ExitMessage": "string",
     "FailureReason": "string",
-    "ProcessingEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "ProcessingStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "ProcessingEndTime": default_time,
+    "ProcessingStartTime": default_time,
+    "LastModifiedTime": default_time,
+    "CreationTime": default_time,
     "MonitoringScheduleArn": "string",
     "AutoMLJobArn": auto_ml_job_arn,
     "TrainingJobArn": training_job_arn,
 }
 
 transform_job_name = "a-transform-job"
-transform_job_arn = (
-    "arn:aws:sagemaker:us-west-2:123412341234:transform-job/a-transform-job"
-)
+transform_job_arn = f"{arn_prefix}transform-job/{transform_job_name}"
 list_transform_jobs_response = {
     "TransformJobSummaries": [
         {
             "TransformJobName": transform_job_name,
             "TransformJobArn": transform_job_arn,
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "TransformEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-            "LastModifiedTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "CreationTime": default_time,
+            "TransformEndTime": default_time,
+            "LastModifiedTime": default_time,
             "TransformJobStatus": "InProgress",
             "FailureReason": "string",
         },
@@ -1153,9 +964,9 @@ describe_transform_job_response = {
         "InstanceCount": 123,
         "VolumeKmsKeyId": "string",
     },
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "TransformStartTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "TransformEndTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+    "CreationTime": default_time,
+    "TransformStartTime": default_time,
+    "TransformEndTime": default_time,
     "LabelingJobArn": labeling_job_arn,
     "AutoMLJobArn": auto_ml_job_arn,
     "DataProcessing": {
@@ -1163,167 +974,154 @@ describe_transform_job_response = {
         "OutputFilter": "string",
         "JoinSource": "Input",  # "Input" | "None"
     },
-    "ExperimentConfig": {
-        "ExperimentName": "string",
-        "TrialName": "string",
-        "TrialComponentDisplayName": "string",
-    },
+    "ExperimentConfig": experiment_config,
 }
 
+_job_specs = (
+    (
+        "auto_ml",
+        list_auto_ml_jobs_response,
+        describe_auto_ml_job_response,
+        auto_ml_job_name,
+    ),
+    (
+        "compilation",
+        list_compilation_jobs_response,
+        describe_compilation_job_response,
+        compilation_job_name,
+    ),
+    (
+        "edge_packaging",
+        list_edge_packaging_jobs_response,
+        describe_edge_packaging_job_response,
+        edge_packaging_job_name,
+    ),
+    (
+        "hyper_parameter_tuning",
+        list_hyper_parameter_tuning_jobs_response,
+        describe_hyper_parameter_tuning_job_response,
+        hyper_parameter_tuning_job_name,
+    ),
+    (
+        "labeling",
+        list_labeling_jobs_response,
+        describe_labeling_job_response,
+        labeling_job_name,
+    ),
+    (
+        "processing",
+        list_processing_jobs_response,
+        describe_processing_job_response,
+        processing_job_name,
+    ),
+    (
+        "training",
+        list_training_jobs_response,
+        describe_training_job_response,
+        training_job_name,
+    ),
+    (
+        "transform",
+        list_transform_jobs_response,
+        describe_transform_job_response,
+        transform_job_name,
+    ),
+)
+
 job_stubs = {
-    "auto_ml": {
-        "list": list_auto_ml_jobs_response,
-        "describe": describe_auto_ml_job_response,
-        "describe_name": auto_ml_job_name,
-    },
-    "compilation": {
-        "list": list_compilation_jobs_response,
-        "describe": describe_compilation_job_response,
-        "describe_name": compilation_job_name,
-    },
-    "edge_packaging": {
-        "list": list_edge_packaging_jobs_response,
-        "describe": describe_edge_packaging_job_response,
-        "describe_name": edge_packaging_job_name,
-    },
-    "hyper_parameter_tuning": {
-        "list": list_hyper_parameter_tuning_jobs_response,
-        "describe": describe_hyper_parameter_tuning_job_response,
-        "describe_name": hyper_parameter_tuning_job_name,
-    },
-    "labeling": {
-        "list": list_labeling_jobs_response,
-        "describe": describe_labeling_job_response,
-        "describe_name": labeling_job_name,
-    },
-    "processing": {
-        "list": list_processing_jobs_response,
-        "describe": describe_processing_job_response,
-        "describe_name": processing_job_name,
-    },
-    "training": {
-        "list": list_training_jobs_response,
-        "describe": describe_training_job_response,
-        "describe_name": training_job_name,
-    },
-    "transform": {
-        "list": list_transform_jobs_response,
-        "describe": describe_transform_job_response,
-        "describe_name": transform_job_name,
-    },
+    job_type: {
+        "list": list_response,
+        "describe": describe_response,
+        "describe_name": name,
+    }
+    for job_type, list_response, describe_response, name in _job_specs
 }
 
 list_models_response = {
     "Models": [
         {
             "ModelName": "the-first-model",
-            "ModelArn": "arn:aws:sagemaker:us-west-2:123412341234:model/the-first-model",
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "ModelArn": f"{arn_prefix}model/the-first-model",
+            "CreationTime": default_time,
         },
         {
             "ModelName": "the-second-model",
-            "ModelArn": "arn:aws:sagemaker:us-west-2:123412341234:model/the-second-model",
-            "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
+            "ModelArn": f"{arn_prefix}model/the-second-model",
+            "CreationTime": default_time,
         },
     ],
 }
-describe_model_response_1 = {
-    "ModelName": "the-first-model",
-    "PrimaryContainer": {
-        "ContainerHostname": "string",
-        "Image": "string",
-        "ImageConfig": {
-            "RepositoryAccessMode": "Platform",  # 'Platform'|'Vpc'
-            "RepositoryAuthConfig": {"RepositoryCredentialsProviderArn": "string"},
-        },
-        "Mode": "SingleModel",  # 'SingleModel'|'MultiModel'
-        "ModelDataUrl": "string",
-        "Environment": {"string": "string"},
-        "ModelPackageName": "string",
-        "MultiModelConfig": {
-            "ModelCacheSetting": "Enabled",  # 'Enabled'|'Disabled'
-        },
-    },
-    "Containers": [
-        {
+
+
+def _make_model(
+    name: str,
+    *,
+    primary_mode: str,
+    primary_cache: str,
+    container_repo_access: str,
+    container_cache: str,
+    network_isolation: bool,
+) -> Dict[str, Any]:
+    return {
+        "ModelName": name,
+        "PrimaryContainer": {
             "ContainerHostname": "string",
             "Image": "string",
             "ImageConfig": {
                 "RepositoryAccessMode": "Platform",  # 'Platform'|'Vpc'
                 "RepositoryAuthConfig": {"RepositoryCredentialsProviderArn": "string"},
             },
-            "Mode": "SingleModel",  # 'SingleModel'|'MultiModel'
+            "Mode": primary_mode,  # 'SingleModel'|'MultiModel'
             "ModelDataUrl": "string",
             "Environment": {"string": "string"},
             "ModelPackageName": "string",
             "MultiModelConfig": {
-                "ModelCacheSetting": "Enabled",  # 'Enabled'|'Disabled'
+                "ModelCacheSetting": primary_cache,  # 'Enabled'|'Disabled'
             },
         },
-    ],
-    "InferenceExecutionConfig": {
-        "Mode": "Serial",  # 'Serial'|'Direct'
-    },
-    "ExecutionRoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMaker-ExecutionRole-20210614T104201",
-    "VpcConfig": {
-        "SecurityGroupIds": [
-            "string",
-        ],
-        "Subnets": [
-            "string",
-        ],
-    },
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "ModelArn": "arn:aws:sagemaker:us-west-2:123412341234:model/the-first-model",
-    "EnableNetworkIsolation": True,  # True | False
-}
-describe_model_response_2 = {
-    "ModelName": "the-second-model",
-    "PrimaryContainer": {
-        "ContainerHostname": "string",
-        "Image": "string",
-        "ImageConfig": {
-            "RepositoryAccessMode": "Platform",  # 'Platform'|'Vpc'
-            "RepositoryAuthConfig": {"RepositoryCredentialsProviderArn": "string"},
-        },
-        "Mode": "MultiModel",  # 'SingleModel'|'MultiModel'
-        "ModelDataUrl": "string",
-        "Environment": {"string": "string"},
-        "ModelPackageName": "string",
-        "MultiModelConfig": {
-            "ModelCacheSetting": "Disabled",  # 'Enabled'|'Disabled'
-        },
-    },
-    "Containers": [
-        {
-            "ContainerHostname": "string",
-            "Image": "string",
-            "ImageConfig": {
-                "RepositoryAccessMode": "Vpc",  # 'Platform'|'Vpc'
-                "RepositoryAuthConfig": {"RepositoryCredentialsProviderArn": "string"},
-            },
-            "Mode": "SingleModel",  # 'SingleModel'|'MultiModel'
-            "ModelDataUrl": "string",
-            "Environment": {"string": "string"},
-            "ModelPackageName": "string",
-            "MultiModelConfig": {
-                "ModelCacheSetting": "Disabled",  # 'Enabled'|'Disabled'
+        "Containers": [
+            {
+                "ContainerHostname": "string",
+                "Image": "string",
+                "ImageConfig": {
+                    "RepositoryAccessMode": container_repo_access,  # 'Platform'|'Vpc'
+                    "RepositoryAuthConfig": {
+                        "RepositoryCredentialsProviderArn": "string"
+                    },
+                },
+                "Mode": "SingleModel",  # 'SingleModel'|'MultiModel'
+                "ModelDataUrl": "string",
+                "Environment": {"string": "string"},
+                "ModelPackageName": "string",
+                "MultiModelConfig": {
+                    "ModelCacheSetting": container_cache,  # 'Enabled'|'Disabled'
+                },
             },
-        },
-    ],
-    "InferenceExecutionConfig": {
-        "Mode": "Serial",  # 'Serial'|'Direct'
-    },
-    "ExecutionRoleArn": "arn:aws:iam::123412341234:role/service-role/AmazonSageMaker-ExecutionRole-20210614T104201",
-    "VpcConfig": {
-        "SecurityGroupIds": [
-            "string",
-        ],
-        "Subnets": [
-            "string",
         ],
-    },
-    "CreationTime": datetime(2015, 1, 1, tzinfo=timezone.utc),
-    "ModelArn": "arn:aws:sagemaker:us-west-2:123412341234:model/the-second-model",
-    "EnableNetworkIsolation": False,  # True | False
-}
+        "InferenceExecutionConfig": {
+            "Mode": "Serial",  # 'Serial'|'Direct'
+        },
+        "ExecutionRoleArn": execution_role_arn,
+        "VpcConfig": vpc_config,
+        "CreationTime": default_time,
+        "ModelArn": f"{arn_prefix}model/{name}",
+        "EnableNetworkIsolation": network_isolation,
+    }
+
+
+describe_model_response_1 = _make_model(
+    "the-first-model",
+    primary_mode="SingleModel",
+    primary_cache="Enabled",
+    container_repo_access="Platform",
+    container_cache="Enabled",
+    network_isolation=True,
+)
+describe_model_response_2 = _make_model(
+    "the-second-model",
+    primary_mode="MultiModel",
+    primary_cache="Disabled",
+    container_repo_access="Vpc",
+    container_cache="Disabled",
+    network_isolation=False,
+)
@@ -1,4 +1,7 @@
+import pytest
+
 from datahub.utilities.delayed_iter import delayed_iter
+from datahub.utilities.prefetch_iter import prefetch_iter
 
 
 def test_delayed_iter():
@@ -22,3 +25,21 @@ def test_delayed_iter():
         ("remove", 2),
         ("remove", 3),
     ]
+
+
+def test_prefetch_iter():
+    assert list(prefetch_iter(range(100), 3)) == list(range(100))
+    assert list(prefetch_iter([], 3)) == []
+
+
+def test_prefetch_iter_error():
+    def maker():
+        yield 0
+        yield 1
+        raise ValueError("source failed")
+
+    results = []
+    with pytest.raises(ValueError, match="source failed"):
+        for i in prefetch_iter(maker(), 2):
+            results.append(i)
+    assert results == [0, 1]